@@ -0,0 +1,38 @@
+import compileall
+import os
+import shutil
+import tempfile
+import zipapp
+
+# Package directory to bundle and the archive to produce, next to this script
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PACKAGE = 'tasks_cli'
+TARGET = os.path.join(ROOT, 'task.pyz')
+
+
+def build(target=TARGET):
+    """
+    Bundle tasks_cli into a single-file zipapp with precompiled bytecode.
+    
+    Args:
+        target (str): Path of the .pyz archive to write
+    """
+    with tempfile.TemporaryDirectory() as staging:
+        shutil.copytree(
+            os.path.join(ROOT, PACKAGE),
+            os.path.join(staging, PACKAGE),
+            ignore=shutil.ignore_patterns('__pycache__', '*.pyc'),
+        )
+        # zipimport only picks up .pyc files stored next to their sources
+        compileall.compile_dir(staging, quiet=1, legacy=True)
+        zipapp.create_archive(
+            staging,
+            target,
+            interpreter='/usr/bin/env python3',
+            main='tasks_cli.core:main',
+        )
+    print(f"✅ Built {target}")
+
+
+if __name__ == "__main__":
+    build()
@@ -0,0 +1,532 @@
+import sys
+import os
+import time
+
+# sys, os and time are already loaded by the interpreter at startup; the JSON
+# library is not, so it's only imported once tasks are actually read or written.
+# _codec() fills this in with the (dumps, loads) pair on first use.
+_json = None
+
+def _codec():
+    """
+    Return the (dumps, loads) pair, importing it on first call.
+    
+    Prefers orjson, falling back to the standard library. Both produce
+    compact single-line JSON as bytes.
+    """
+    global _json
+    if _json is None:
+        try:
+            import orjson
+
+            _json = (orjson.dumps, orjson.loads)
+        except ImportError:
+            import json
+
+            def dumps(obj):
+                return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+            _json = (dumps, json.loads)
+    return _json
+
+# File to persist tasks data, one JSON task per line (NDJSON)
+FILE_NAME = 'tasks.ndjson'
+# Files at least this big are parsed from an mmap instead of one read() buffer
+MMAP_THRESHOLD = 64 * 1024
+# Older single-array file, converted to FILE_NAME on first read
+LEGACY_FILE_NAME = 'tasks.json'
+# Sidecar file holding the next task ID and the (mtime, size) of FILE_NAME it
+# was saved for, so adding a task needs no parse of FILE_NAME
+META_FILE = 'tasks.meta.json'
+
+# Statuses accepted by mark_task
+_VALID_STATUSES = frozenset({"todo", "in-progress", "done"})
+
+# Emoji used to represent each task status visually when listing
+STATUS_EMOJI = {"done": "✅", "in-progress": "⏳", "todo": "📝"}
+STATUS_DEFAULT = "📝"
+# Separator line around the task list
+SEP = "-" * 80
+
+# In-memory copy of the tasks list, along with the (mtime, size) of
+# FILE_NAME it was loaded from so external edits are picked up
+_cache = None
+_cache_token = None
+# Maps task ID -> position in _index_tasks (the cached list, or an open
+# TaskSession's copy of it), built on first lookup
+_index_tasks = None
+_index = None
+# Next task ID to hand out, loaded from META_FILE alongside the tasks
+_next_id = None
+
+# ============== UTILITY FUNCTIONS ==============
+# These functions handle file operations and data management
+
+def atomic_write(path, data):
+    """
+    Write data to path via a temp file and rename.
+    
+    If the process dies or the write fails, path keeps its old contents. There
+    is no fsync, so this does not protect against power loss or an OS crash.
+    """
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        # Don't leave a partial temp file behind
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+def file_token():
+    """Return a (mtime, size) pair identifying the current tasks file contents."""
+    st = os.stat(FILE_NAME)
+    return (st.st_mtime_ns, st.st_size)
+
+def read_tasks():
+    """Read and return all tasks from the NDJSON file (cached until the file changes)."""
+    global _cache, _cache_token, _next_id
+    # The stat doubles as the existence check; a missing file means no tasks yet
+    try:
+        token = file_token()
+    except FileNotFoundError:
+        token = None
+    if _cache is not None and token == _cache_token:
+        return _cache
+
+    if token is None:
+        _cache = []
+    else:
+        _, loads = _codec()
+        with open(FILE_NAME, 'rb') as f:
+            if token[1] >= MMAP_THRESHOLD:
+                # Pull lines straight out of the page cache rather than
+                # copying the whole file into one bytes object first
+                import mmap
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    lines = iter(mm.readline, b"")
+                    _cache = [loads(line) for line in lines if line.strip()]
+            else:
+                data = f.read()
+                _cache = [loads(line) for line in data.splitlines() if line.strip()]
+    _cache_token = token
+    _next_id = None
+
+    if token is None and os.path.exists(LEGACY_FILE_NAME):
+        migrate_legacy_file()
+    else:
+        load_next_id(_cache)
+    return _cache
+
+def migrate_legacy_file():
+    """Convert the old tasks.json array into FILE_NAME (the old file is kept)."""
+    _, loads = _codec()
+    with open(LEGACY_FILE_NAME, 'rb') as f:
+        write_tasks(loads(f.read()))
+    
+def write_tasks(tasks):
+    """Write/save the whole tasks list to the NDJSON file."""
+    global _cache, _cache_token, _next_id
+    if tasks is not _cache:
+        _cache = tasks
+        _next_id = None
+    load_next_id(tasks)
+    dumps, _ = _codec()
+    try:
+        # Encode in memory first so the file gets a single write() call
+        atomic_write(FILE_NAME, b"".join(dumps(task) + b"\n" for task in tasks))
+        _cache_token = file_token()
+    except BaseException:
+        # The list was changed in place but never saved; make the next read reload it
+        _cache = None
+        raise
+    write_meta(_cache_token)
+
+def append_task(task):
+    """Append a single task to the NDJSON file without rewriting the others."""
+    global _cache, _cache_token
+    dumps, _ = _codec()
+    try:
+        with open(FILE_NAME, 'ab') as f:
+            f.write(dumps(task) + b"\n")
+        token = file_token()
+    except BaseException:
+        _cache = None
+        raise
+    # When the list is cached, add_task has already appended the task to it
+    if _cache is not None:
+        _cache_token = token
+    write_meta(token)
+
+def prepare_append():
+    """
+    Load the next ID from META_FILE so add_task can append without parsing FILE_NAME.
+    
+    Returns True on success, or False when the tasks have to be read
+    instead: the file is missing (it may need migrating), the cached list is
+    still current, or the metadata is missing, unreadable, or was written for
+    a different version of FILE_NAME (a hand edit, or a crash between
+    appending a task and saving the metadata).
+    """
+    global _cache, _next_id
+    try:
+        token = file_token()
+    except FileNotFoundError:
+        return False
+    if _cache is not None and token == _cache_token:
+        return False
+
+    meta = read_meta()
+    if meta is None or meta.get("token") != list(token):
+        return False
+    # The cached list is out of date and won't be reloaded here
+    _cache = None
+    _next_id = meta["next_id"]
+    return True
+
+def read_meta():
+    """Read the sidecar metadata, or return None if it's missing or unreadable."""
+    _, loads = _codec()
+    try:
+        with open(META_FILE, 'rb') as f:
+            meta = loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return None
+    if not isinstance(meta, dict) or not isinstance(meta.get("next_id"), int):
+        return None
+    return meta
+
+def write_meta(token):
+    """
+    Write the next ID to the sidecar metadata file.
+    
+    Args:
+        token (tuple): file_token() of FILE_NAME, taken right after writing it
+    """
+    meta = {"next_id": _next_id, "token": list(token)}
+    dumps, _ = _codec()
+    atomic_write(META_FILE, dumps(meta))
+
+def load_next_id(tasks):
+    """
+    Load the next task ID for tasks unless it's already known.
+    
+    The tasks are already parsed here, so the counter from META_FILE is
+    checked against the max ID and never allowed below max ID + 1. That keeps
+    IDs unique when the metadata is missing or out of date (e.g. after a hand
+    edit), while IDs of deleted tasks are still not handed out again.
+    """
+    global _next_id
+    if _next_id is not None:
+        return
+    _next_id = max((task["id"] for task in tasks), default=0) + 1
+    meta = read_meta()
+    if meta is not None and meta["next_id"] > _next_id:
+        _next_id = meta["next_id"]
+
+def find_task(tasks, task_id):
+    """Return the position of the task with the given ID in tasks, or None."""
+    global _index_tasks, _index
+    if tasks is _index_tasks:
+        i = _index.get(task_id)
+        if i is not None and i < len(tasks) and tasks[i]["id"] == task_id:
+            return i
+    # Build (or rebuild, if the list changed behind our back) the index
+    _index_tasks = tasks
+    _index = {task["id"]: i for i, task in enumerate(tasks)}
+    return _index.get(task_id)
+
+def generate_id(tasks):
+    """
+    Generate a unique ID for a new task from the persisted counter.
+    
+    The counter is saved to META_FILE on every write; see load_next_id().
+    tasks may be None when prepare_append() has already loaded the counter.
+    """
+    global _next_id
+    if _next_id is None:
+        load_next_id(tasks)
+    task_id = _next_id
+    _next_id += 1
+    return task_id
+
+def current_time():
+    """Get the current local timestamp in ISO 8601 format (to the second)."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime())
+
+
+# ============== CLI COMMAND FUNCTIONS ==============
+# Each function handles a specific task operation
+
+def add_task(description, tasks=None):
+    """
+    Create and add a new task to the list.
+    
+    Args:
+        description (str): Task description
+        tasks (list, optional): Task list to modify in place; when given, the
+            file is neither read nor written (see TaskSession)
+    """
+    if not description:
+        print("❌ Description is required.")
+        return
+
+    # Take the timestamp before touching the file
+    now = current_time()
+    save = tasks is None
+    if save:
+        # Appending only needs the next ID, so skip parsing the file when the
+        # metadata provides it
+        if not prepare_append():
+            tasks = read_tasks()
+
+    # Create a new task object with unique ID and metadata
+    task = {
+        "id": generate_id(tasks),
+        "description": description,
+        "status": "todo",
+        "createdAt": now,
+        "updatedAt": now
+    }
+
+    if tasks is not None:
+        tasks.append(task)
+        if tasks is _index_tasks:
+            _index[task["id"]] = len(tasks) - 1
+    if save:
+        append_task(task)
+    print("✅ Task added:", task)
+
+def update_task(task_id, description, tasks=None):
+    """
+    Update an existing task's description.
+    
+    Args:
+        task_id (int): The ID of the task to update
+        description (str): New task description
+        tasks (list, optional): Task list to modify in place instead of the file
+    """
+    if not description:
+        print("❌ Description is required.")
+        return
+    
+    now = current_time()
+    save = tasks is None
+    if save:
+        tasks = read_tasks()
+    i = find_task(tasks, task_id)
+    if i is None:
+        print(f"❌ Task with id {task_id} not found.")
+        return
+
+    task = tasks[i]
+    task["description"] = description
+    task["updatedAt"] = now
+    if save:
+        write_tasks(tasks)
+    print("✅ Task updated:", task)
+
+def delete_task(task_id, tasks=None):
+    """
+    Delete a task by its ID.
+    
+    Args:
+        task_id (int): The ID of the task to delete
+        tasks (list, optional): Task list to modify in place instead of the file
+    """
+    global _index_tasks
+    save = tasks is None
+    if save:
+        tasks = read_tasks()
+    i = find_task(tasks, task_id)
+    if i is None:
+        print(f"❌ Task with id {task_id} not found.")
+        return
+
+    removed = tasks.pop(i)
+    # Positions after i have shifted, so the index has to be rebuilt
+    if tasks is _index_tasks:
+        _index_tasks = None
+    if save:
+        write_tasks(tasks)
+    print(f"✅ Task deleted:", removed)
+
+def mark_task(task_id, status, tasks=None):
+    """
+    Update a task's status (todo, in-progress, or done).
+    
+    Args:
+        task_id (int): The ID of the task to update
+        status (str): New status ('todo', 'in-progress', or 'done')
+        tasks (list, optional): Task list to modify in place instead of the file
+    """
+    if status not in _VALID_STATUSES:
+        print("❌ Invalid status. Use 'todo', 'in-progress', or 'done'.")
+        return
+    
+    now = current_time()
+    save = tasks is None
+    if save:
+        tasks = read_tasks()
+    i = find_task(tasks, task_id)
+    if i is None:
+        print(f"❌ Task with id {task_id} not found.")
+        return
+
+    task = tasks[i]
+    task["status"] = status
+    task["updatedAt"] = now
+    if save:
+        write_tasks(tasks)
+    print(f"✅ Task marked as {status}:", task)
+
+def list_tasks(status_filter=None):
+    """
+    Display all tasks or filter by status.
+    
+    Args:
+        status_filter (str, optional): Filter tasks by status ('todo', 'in-progress', 'done')
+    """
+    tasks = read_tasks()
+    
+    if not tasks:
+        print("📋 No tasks found.")
+        return
+    
+    # Apply status filter if provided
+    if status_filter:
+        tasks = [task for task in tasks if task["status"] == status_filter]
+        if not tasks:
+            print(f"📋 No tasks with status '{status_filter}'.")
+            return
+    
+    # Build the whole listing first so it goes out in a single write
+    lines = [f"\n📋 Tasks:\n{SEP}\n"]
+    for task in tasks:
+        status_emoji = STATUS_EMOJI.get(task["status"], STATUS_DEFAULT)
+        lines.append(
+            f"{status_emoji} [{task['id']}] {task['description']}\n"
+            f"   Status: {task['status']} | Created: {task['createdAt']} | Updated: {task['updatedAt']}\n"
+        )
+    lines.append(f"{SEP}\n")
+    sys.stdout.write("".join(lines))
+
+
+# ============== BATCH SESSION ==============
+# Groups several changes into a single read and a single write
+
+class TaskSession:
+    """
+    Context manager that loads the tasks once and writes them back once on exit.
+    
+    Example:
+        with TaskSession() as s:
+            s.add("Buy milk")
+            s.mark(1, "done")
+    """
+
+    def __enter__(self):
+        # Work on a copy so the cache (and anything else reading the tasks)
+        # never sees changes that haven't been saved yet
+        self.tasks = [dict(task) for task in read_tasks()]
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # A failed write_tasks() drops the cache itself; if the body raised,
+        # the copy is simply discarded
+        if exc_type is None:
+            write_tasks(self.tasks)
+        return False
+
+    def add(self, description):
+        add_task(description, self.tasks)
+
+    def update(self, task_id, description):
+        update_task(task_id, description, self.tasks)
+
+    def delete(self, task_id):
+        delete_task(task_id, self.tasks)
+
+    def mark(self, task_id, status):
+        mark_task(task_id, status, self.tasks)
+
+
+# ============== CLI DISPATCH ==============
+# Each handler receives the arguments after the command (and the parsed task
+# ID for commands that take one)
+
+USAGE = "Usage: python task.py [add|update|delete|mark|list] [arguments]"
+HELP = f"""{USAGE}
+
+Commands:
+  add <description>           - Add a new task
+  update <id> <description>   - Update a task
+  delete <id>                 - Delete a task
+  mark <id> <status>          - Mark task as 'todo', 'in-progress', or 'done'
+  list [status]               - List all tasks or filter by status"""
+
+def _cmd_add(args):
+    add_task(" ".join(args))
+
+def _cmd_update(task_id, args):
+    update_task(task_id, " ".join(args))
+
+def _cmd_delete(task_id, args):
+    delete_task(task_id)
+
+def _cmd_mark(task_id, args):
+    mark_task(task_id, args[0])
+
+def _cmd_list(args):
+    # Optional status filter for listing
+    list_tasks(args[0] if args else None)
+
+# command -> (handler, minimum number of arguments, whether args[0] is a task ID)
+COMMANDS = {
+    "add": (_cmd_add, 1, False),
+    "update": (_cmd_update, 2, True),
+    "delete": (_cmd_delete, 1, True),
+    "mark": (_cmd_mark, 2, True),
+    "list": (_cmd_list, 0, False),
+}
+
+
+def main():
+    """
+    Main entry point for the task tracker CLI.
+    Parses command-line arguments and executes the appropriate command.
+    """
+    argv = sys.argv
+    # Display help if no command is provided
+    if len(argv) < 2:
+        print(HELP)
+        return
+
+    # Route commands to appropriate functions
+    entry = COMMANDS.get(argv[1])
+    args = argv[2:]
+    if entry is None or len(args) < entry[1]:
+        print("❌ Invalid command or missing arguments.")
+        print(USAGE)
+        return
+
+    handler, _, takes_id = entry
+    if not takes_id:
+        handler(args)
+        return
+
+    try:
+        task_id = int(args[0])
+    except ValueError:
+        print("❌ Task id must be an integer.")
+        return
+    handler(task_id, args[1:])
+
+# ============== ENTRY POINT ==============
+# Run the main function when the script is executed directly
+if __name__ == "__main__":
+    main()
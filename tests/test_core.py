@@ -0,0 +1,250 @@
+import contextlib
+import errno
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from tasks_cli import core
+
+
+class TaskFileTestCase(unittest.TestCase):
+    """Runs each test in an empty temp directory with a fresh module state."""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.reset_state()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def reset_state(self):
+        """Forget everything cached in memory, like a new CLI invocation."""
+        core._cache = None
+        core._cache_token = None
+        core._index_tasks = None
+        core._index = None
+        core._next_id = None
+
+    def add(self, description):
+        with contextlib.redirect_stdout(io.StringIO()):
+            core.add_task(description)
+
+    def read_file(self):
+        """Read the task file directly, bypassing the module."""
+        with open(core.FILE_NAME) as f:
+            return [json.loads(line) for line in f]
+
+    def write_file(self, tasks):
+        """Write the task file by hand, bypassing the module."""
+        with open(core.FILE_NAME, 'w') as f:
+            f.writelines(json.dumps(t) + "\n" for t in tasks)
+
+    def ids(self):
+        self.reset_state()
+        return [t["id"] for t in core.read_tasks()]
+
+    @contextlib.contextmanager
+    def disk_full(self):
+        """Make every atomic_write() fail as if the disk were full."""
+        def fail(path, data):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        atomic_write = core.atomic_write
+        core.atomic_write = fail
+        try:
+            yield
+        finally:
+            core.atomic_write = atomic_write
+
+
+class CacheTest(TaskFileTestCase):
+
+    def test_failed_write_does_not_leave_unsaved_changes_cached(self):
+        self.add("a")
+        self.add("b")
+        with self.disk_full(), self.assertRaises(OSError):
+            with contextlib.redirect_stdout(io.StringIO()):
+                core.delete_task(1)
+        self.assertEqual([t["id"] for t in core.read_tasks()], [1, 2])
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            core.mark_task(2, "done")
+        self.assertEqual(self.ids(), [1, 2])
+
+
+class StorageTest(TaskFileTestCase):
+
+    def test_legacy_json_array_is_converted_to_ndjson(self):
+        legacy = [
+            {"id": 3, "description": "old", "status": "done",
+             "createdAt": "2024-01-01T00:00:00", "updatedAt": "2024-01-02T00:00:00"},
+            {"id": 7, "description": "older", "status": "todo",
+             "createdAt": "2024-01-01T00:00:00", "updatedAt": "2024-01-01T00:00:00"},
+        ]
+        with open(core.LEGACY_FILE_NAME, 'w') as f:
+            json.dump(legacy, f, indent=2)
+
+        self.assertEqual(core.read_tasks(), legacy)
+        self.assertEqual(self.read_file(), legacy)
+        self.add("new")
+        self.assertEqual(self.ids(), [3, 7, 8])
+        # The old file is left alone
+        with open(core.LEGACY_FILE_NAME) as f:
+            self.assertEqual(json.load(f), legacy)
+
+
+    def test_large_file_parses_the_same_through_mmap(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            with core.TaskSession() as s:
+                for i in range(50):
+                    s.add(f"task {i} ✅")
+        # Blank lines are skipped on both paths
+        with open(core.FILE_NAME, 'ab') as f:
+            f.write(b"\n")
+        self.reset_state()
+        via_read = core.read_tasks()
+
+        threshold = core.MMAP_THRESHOLD
+        core.MMAP_THRESHOLD = 1
+        try:
+            self.reset_state()
+            via_mmap = core.read_tasks()
+        finally:
+            core.MMAP_THRESHOLD = threshold
+        self.assertEqual(len(via_mmap), 50)
+        self.assertEqual(via_mmap, via_read)
+
+    def test_failed_atomic_write_keeps_the_old_file_and_removes_the_temp_file(self):
+        self.add("a")
+        with open(core.FILE_NAME, 'rb') as f:
+            before = f.read()
+
+        real_replace = os.replace
+
+        def fail(src, dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        os.replace = fail
+        try:
+            with self.assertRaises(OSError):
+                core.atomic_write(core.FILE_NAME, b"new")
+        finally:
+            os.replace = real_replace
+        with open(core.FILE_NAME, 'rb') as f:
+            self.assertEqual(f.read(), before)
+        self.assertEqual(sorted(os.listdir()), sorted([core.FILE_NAME, core.META_FILE]))
+
+
+class SessionTest(TaskFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.add("a")
+        self.add("b")
+
+    def test_changes_are_written_on_exit(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            with core.TaskSession() as s:
+                s.add("c")
+                s.delete(1)
+                s.mark(3, "done")
+                # Nothing outside the session sees the changes before exit
+                self.assertEqual([t["id"] for t in core.read_tasks()], [1, 2])
+        self.assertEqual([t["id"] for t in core.read_tasks()], [2, 3])
+        self.assertEqual(self.ids(), [2, 3])
+        self.assertEqual(core.read_tasks()[1]["status"], "done")
+
+    def test_changes_are_discarded_when_the_body_raises(self):
+        with self.assertRaises(RuntimeError):
+            with contextlib.redirect_stdout(io.StringIO()):
+                with core.TaskSession() as s:
+                    s.delete(1)
+                    s.mark(2, "done")
+                    raise RuntimeError
+        tasks = core.read_tasks()
+        self.assertEqual([t["id"] for t in tasks], [1, 2])
+        self.assertEqual(tasks[1]["status"], "todo")
+        self.assertEqual(self.ids(), [1, 2])
+
+    def test_changes_are_discarded_when_the_write_fails(self):
+        with self.disk_full(), self.assertRaises(OSError):
+            with contextlib.redirect_stdout(io.StringIO()):
+                with core.TaskSession() as s:
+                    s.delete(1)
+        self.assertEqual([t["id"] for t in core.read_tasks()], [1, 2])
+        self.assertEqual(self.ids(), [1, 2])
+
+
+class NextIdTest(TaskFileTestCase):
+
+    def test_deleted_ids_are_not_reused(self):
+        self.add("a")
+        self.add("b")
+        with contextlib.redirect_stdout(io.StringIO()):
+            core.delete_task(2)
+        self.reset_state()
+        self.add("c")
+        self.assertEqual(self.ids(), [1, 3])
+
+    def test_hand_edit_keeping_the_count_does_not_reuse_an_id(self):
+        self.add("a")
+        self.add("b")
+        # Swap task 2 for a hand-written task 3; the count stays at 2
+        tasks = self.read_file()
+        tasks[1]["id"] = 3
+        self.write_file(tasks)
+        self.reset_state()
+        self.add("c")
+        self.assertEqual(self.ids(), [1, 3, 4])
+
+
+class AppendTest(TaskFileTestCase):
+
+    def test_append_skips_parsing_when_metadata_is_current(self):
+        self.add("a")
+        self.reset_state()
+        read_tasks = core.read_tasks
+        core.read_tasks = lambda: self.fail("read_tasks() was called")
+        try:
+            self.add("b")
+        finally:
+            core.read_tasks = read_tasks
+        self.assertEqual(self.ids(), [1, 2])
+
+    def test_hand_appended_task_does_not_get_its_id_reused(self):
+        self.add("a")
+        self.add("b")
+        tasks = self.read_file()
+        tasks.append(dict(tasks[0], id=3))
+        self.write_file(tasks)
+        self.reset_state()
+        self.add("c")
+        self.add("d")
+        self.assertEqual(self.ids(), [1, 2, 3, 4, 5])
+
+    def test_crash_before_saving_metadata_does_not_reuse_an_id(self):
+        self.add("a")
+        self.reset_state()
+        write_meta = core.write_meta
+
+        def crash(*args):
+            raise KeyboardInterrupt
+
+        core.write_meta = crash
+        try:
+            with self.assertRaises(KeyboardInterrupt):
+                self.add("b")
+        finally:
+            core.write_meta = write_meta
+        self.reset_state()
+        self.add("c")
+        self.assertEqual(self.ids(), [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()